@@ -4,6 +4,15 @@ from picoware.system.buttons import BUTTON_BACK, BUTTON_ESCAPE # Import hardware
 import math # Import math library strictly for initial lookup table generation
 import random # Import random library to scatter snowflakes naturally
 import time # Import time library to handle the 5-second initial delay
+import array # Import array library for packed, unboxed numeric buffers
+import gc # Import garbage collector to make room for the rotation cache
+try: # Probe for the MicroPython runtime module
+    import micropython # The compiler turns @micropython.native and @micropython.viper kernels into machine code
+except ImportError: # Desktop Python has no native code emitter
+    class micropython: # Minimal stand-in so the decorators below still resolve
+        native = staticmethod(lambda f: f) # Fall back to a no-op decorator
+        viper = staticmethod(lambda f: f) # Fall back to a no-op decorator
+    ptr8 = ptr16 = ptr32 = lambda buf: buf # Viper pointer casts: plain indexing of the typed arrays behaves the same on desktop
 BUTTON_G = 13 # Map the 'g' key manually to integer 13 to avoid framework import issues
 BUTTON_R = 24 # Map the 'r' key manually to integer 24 to avoid framework import issues
 
@@ -36,47 +45,90 @@ LOGO_LINES = [ # Define the start and end points for the custom vectorized lette
     (33, -6, 38, -6), (33, -6, 33, 6), (33, 6, 38, 6), (38, 0, 38, 6), (33, 0, 38, 0) # Number 6
 ] # End of custom text list
 
+BOX_LINES = [ # Define the four outline edges of the logo box
+    (L_LEFT, L_TOP, L_RIGHT, L_TOP), (L_RIGHT, L_TOP, L_RIGHT, L_BOT), # Top edge, right edge
+    (L_RIGHT, L_BOT, L_LEFT, L_BOT), (L_LEFT, L_BOT, L_LEFT, L_TOP) # Bottom edge, left edge
+] # End of box outline list
+
 GRAVITY = 0.08 # Define downward acceleration added to snow every single frame
+GRAVITY_Q = int(GRAVITY * 65536) # Same gravity in Q16.16 fixed point for the integer snow physics
 FRICTION = 0.95 # Define damping factor to slow down snow sliding on the logo
 MAX_SNOW = 10 # HARD CAP: Reduced to 10 massive falling snowflakes maximum
-MAX_PILE = 200 # Set a hard cap on maximum accumulated snow pixels on the logo
-ROT_STEPS = 126 # Define the number of steps in our 360 degree rotation (approx 2pi / 0.05)
+MAX_PILE = 200 # Set a hard cap on maximum accumulated snow pixels on the logo, shared by all four edges
+ROT_STEPS = 128 # Define the number of steps in our 360 degree rotation (2pi / 128 = ~0.049 rad each)
+QUARTER = ROT_STEPS // 4 # Steps per 90 degrees, the period of the sine/cosine symmetry (ROT_STEPS must be a multiple of 4)
 MELT_RATE = 60 # Set to 60 frames so the snow takes a few seconds to melt away
+RAND_MASK = 1023 # Size of the pre-generated random pool minus one (power of two for cheap wrapping)
+PARTIAL_REDRAW = False # Set True to only redraw what changed; only safe if the display keeps the back buffer's pixels across swap()
+
+# --- HELP TEXT: (x, y, text) per line, shared by the painter and the UI box below ---
+FONT_W = 8 # Upper bound on the default font cell width: eggtimer.py fits 15 character labels into 125 pixels
+FONT_H = 16 # Upper bound on the default font cell height: eggtimer.py stacks its footer rows 17 pixels apart
+UI_WAIT = ((10, 10, "WAIT 5 SECONDS..."), (10, 25, "[ESC]: EXIT")) # Help text during the initial wait
+UI_PAUSED = ((5, 5, "[G]: PAUSED"), (5, 20, "[R]: RESET"), (5, 35, "[ESC]: EXIT")) # Help text while the logo is paused
+UI_ROTATING = ((5, 5, "[G]: ROTATING"), (5, 20, "[R]: RESET"), (5, 35, "[ESC]: EXIT")) # Help text while the logo rotates
 
 # --- RAM FOR SPEED: PRE-COMPUTED TRIGONOMETRY LOOKUP TABLES (LUT) ---
-SIN_LUT = [0.0] * ROT_STEPS # Allocate an array for 126 pre-calculated sine values
-COS_LUT = [0.0] * ROT_STEPS # Allocate an array for 126 pre-calculated cosine values
-for i in range(ROT_STEPS): # Loop through all possible rotation steps
-    angle = i * 0.05 # Calculate the actual radian angle for this step
-    SIN_LUT[i] = math.sin(angle) # Calculate and store the sine value permanently
-    COS_LUT[i] = math.cos(angle) # Calculate and store the cosine value permanently
+# Only the first quarter turn is stored, the other three quadrants are the same values with swapped signs
+QS = array.array('f', bytes(4 * (QUARTER + 1))) # Allocate QUARTER + 1 sines covering 0..90 degrees inclusive
+for i in range(QUARTER + 1): # Loop through the first quarter turn, both ends included
+    QS[i] = math.sin(i * 2 * math.pi / ROT_STEPS) # Calculate the sine value once at boot
+
+def sincos(a): # Function to decode the (sine, cosine) pair of angle index a from the quarter table
+    q, r = divmod(a, QUARTER) # Quadrant number and step within the quadrant, derived from QUARTER alone
+    q &= 3 # BITWISE MATH: Wrap the quadrant so any index past a full turn still decodes
+    s = QS[r] # Sine of the in-quadrant angle
+    c = QS[QUARTER - r] # Cosine of the in-quadrant angle is the mirrored sine
+    if q == 0: return s, c # 0..90 degrees
+    if q == 1: return c, -s # 90..180 degrees
+    if q == 2: return -s, -c # 180..270 degrees
+    return -c, s # 270..360 degrees
+
+# --- RAM FOR SPEED: PRE-GENERATED RANDOM POOL FOR SNOW SPAWNING ---
+RAND_POOL = array.array('f', bytes(4 * (RAND_MASK + 1))) # Allocate a ring buffer of 1024 random floats
+for i in range(RAND_MASK + 1): # Loop through every slot of the ring buffer
+    RAND_POOL[i] = random.random() # Pay for the random generator once at load time
 
 # --- TRUE ZERO ALLOCATION: SHARED VECTORS & PARALLEL ARRAYS ---
 state = {} # Initialize an empty global dictionary to hold the application state
-box_pts = [] # Flat list to hold pre-calculated local X,Y coordinates for the blue box
-text_pts = [] # Flat list to hold pre-calculated local X,Y coordinates for the cyan text
 v_pixel = Vector(0, 0) # Pre-allocate a shared Vector for drawing individual pixels
 v_pos = Vector(0, 0) # Pre-allocate a shared Vector for UI text and rect positioning
 v_size = Vector(0, 0) # Pre-allocate a shared Vector for dynamic rect sizing
 v_flake = Vector(4, 4) # INCREASED: Pre-allocate a fixed Vector for much larger 4x4 snowflake sizes
 
-# Parallel arrays for SNOW (Eliminates dictionary hash lookups)
-sn_act = [False] * MAX_SNOW # Array tracking if snowflake index is currently active
-sn_x = [0.0] * MAX_SNOW # Array tracking X coordinate of each snowflake
-sn_y = [0.0] * MAX_SNOW # Array tracking Y coordinate of each snowflake
-sn_vx = [0.0] * MAX_SNOW # Array tracking X velocity of each snowflake
-sn_vy = [0.0] * MAX_SNOW # Array tracking Y velocity of each snowflake
-sn_px = [0.0] * MAX_SNOW # Array tracking previous X coordinate of each snowflake
-sn_py = [0.0] * MAX_SNOW # Array tracking previous Y coordinate of each snowflake
-
-# Parallel arrays for PILE (Eliminates dictionary hash lookups)
-pl_act = [False] * MAX_PILE # Array tracking if pile pixel index is currently active
-pl_rx = [0.0] * MAX_PILE # Array tracking relative X coordinate of each pile pixel
-pl_ry = [0.0] * MAX_PILE # Array tracking relative Y coordinate of each pile pixel
-pl_sv = [0.0] * MAX_PILE # Array tracking sliding velocity of each pile pixel
-pl_edge = [0] * MAX_PILE # Array tracking which edge the pixel is on (0=Top, 1=Bot, 2=Left, 3=Right)
-
-def cache_line(pts_list, x0, y0, x1, y1): # Function to pre-compute Bresenham line pixels ONCE
+box_rot = [] # RAM FOR SPEED: One pre-rotated int8 copy of the box point cloud per step of the first quarter turn
+text_rot = [] # RAM FOR SPEED: One pre-rotated int8 copy of the text point cloud per step of the first quarter turn
+QUAD_M = ((1, 0, 0, 1), (0, -1, 1, 0), (-1, 0, 0, -1), (0, 1, -1, 0)) # Integer (xx, xy, yx, yy) matrices turning a quarter frame by 0/90/180/270 degrees
+xy_buf = array.array('h') # Scratch buffer of absolute X,Y pairs for the batched pixel sink, sized in start()
+xy_views = [] # One view per used length of the scratch buffer (index n // 2), each sliced once on first use
+pixel_sink = None # The framework's batched pixel method, looked up once in start() (None = per-pixel fallback)
+pile_pts = array.array('b', bytes(2 * MAX_PILE)) # Rotated local X,Y pairs of the active pile pixels, filled every frame (within +/-47, like the logo frames)
+pile_old = array.array('b', bytes(2 * MAX_PILE)) # Pile pairs currently on screen, kept to erase them next frame
+xy_geo = array.array('i', bytes(4 * 6)) # Offset and quadrant matrix (ox, oy, xx, xy, yx, yy) handed to the viper point kernel
+sim_par = array.array('i', bytes(4 * 10)) # Per-frame scalars (c_q, s_q, xmin, ymin, xmax, ymax, scr_h, g_chunks, cx, cy) for the viper snow kernel
+snow_pts = array.array('h', bytes(4 * MAX_SNOW)) # Whole pixel X,Y pairs of the active snowflakes, filled every frame
+snow_old = array.array('h', bytes(4 * MAX_SNOW)) # Snowflake pairs currently on screen, kept to erase them next frame
+UI_BOX = ( # Inclusive screen box (xmin, ymin, xmax, ymax) covering every help text line of every stage
+    min(x for x, y, t in UI_WAIT + UI_PAUSED + UI_ROTATING), # Leftmost line start
+    min(y for x, y, t in UI_WAIT + UI_PAUSED + UI_ROTATING), # Topmost line start
+    max(x + len(t) * FONT_W for x, y, t in UI_WAIT + UI_PAUSED + UI_ROTATING) - 1, # Right edge of the widest line
+    max(y + FONT_H for x, y, t in UI_WAIT + UI_PAUSED + UI_ROTATING) - 1) # Bottom edge of the lowest line
+
+# Parallel arrays for SNOW (Packed Q16.16 integers: no boxed floats, no dictionary hash lookups)
+# Snow active flags live as a bitmask in state["sn_mask"] (bit i set = slot i active); MAX_SNOW keeps it a small int
+sn_x = array.array('i', bytes(4 * MAX_SNOW)) # Array tracking Q16 X coordinate of each snowflake
+sn_y = array.array('i', bytes(4 * MAX_SNOW)) # Array tracking Q16 Y coordinate of each snowflake
+sn_vx = array.array('i', bytes(4 * MAX_SNOW)) # Array tracking Q16 X velocity of each snowflake
+sn_vy = array.array('i', bytes(4 * MAX_SNOW)) # Array tracking Q16 Y velocity of each snowflake
+sn_free = list(range(MAX_SNOW)) # Free-list stack of dormant snowflake indices for O(1) spawning
+
+# Parallel arrays for PILE, one sub-pool per edge (0=Top, 1=Bot, 2=Left, 3=Right): no stored edge ID, no edge branches
+pl_pos = [array.array('f', bytes(4 * MAX_PILE)) for e in range(4)] # Arrays tracking each pile pixel's coordinate along its edge
+pl_sv = [array.array('f', bytes(4 * MAX_PILE)) for e in range(4)] # Arrays tracking sliding velocity of each pile pixel
+pl_act = [bytearray(MAX_PILE) for e in range(4)] # Active flags of each pile pixel: byte flags, since wide bitmasks would spill into heap-allocated big ints
+pl_free = [list(range(MAX_PILE - 1, -1, -1)) for e in range(4)] # Free-list stacks of dormant pile pixel indices, popping the lowest slot first
+
+def bresenham_emit(x0, y0, x1, y1, emit): # Function to walk Bresenham line pixels, handing each one to emit(x, y)
     x0, y0, x1, y1 = int(x0), int(y0), int(x1), int(y1) # Ensure coordinates are integers
     dx = abs(x1 - x0) # Calculate absolute horizontal distance
     sx = 1 if x0 < x1 else -1 # Determine horizontal step direction
@@ -84,8 +136,7 @@ def cache_line(pts_list, x0, y0, x1, y1): # Function to pre-compute Bresenham li
     sy = 1 if y0 < y1 else -1 # Determine vertical step direction
     err = dx + dy # Initialize the mathematical error term
     while True: # Begin pixel plotting loop
-        pts_list.append(x0) # Append the X coordinate sequentially to the flat list
-        pts_list.append(y0) # Append the Y coordinate sequentially to the flat list
+        emit(x0, y0) # Hand the pixel straight to the consumer, no intermediate list
         if x0 == x1 and y0 == y1: break # Exit when endpoint is reached
         e2 = 2 * err # Calculate double error
         if e2 >= dy: # Evaluate X shift
@@ -95,8 +146,362 @@ def cache_line(pts_list, x0, y0, x1, y1): # Function to pre-compute Bresenham li
             err += dx # Adjust error
             y0 += sy # Shift Y
 
+@micropython.native
+def _emit_rotated(frames, k, x, y): # Native kernel: write local pixel (x, y) at index k of every quarter-turn frame
+    for r in range(QUARTER): # Only rotate through the first quarter turn, the draw applies the other quadrants
+        s = QS[r] # Lookup the sine value for this angle
+        c = QS[QUARTER - r] # The cosine is the mirrored sine
+        f = frames[r] # Rotated frame of this angle
+        f[k] = int(x * c - y * s) # Rotate X around the logo origin
+        f[k + 1] = int(x * s + y * c) # Rotate Y around the logo origin
+
+def cache_rotated(frames, lines): # Function to rasterize line segments straight into one rotated frame per angle ONCE
+    n = 0 # Count the pixels first so every frame is allocated exactly once
+    for line in lines: # Iterate through all segments
+        n += max(abs(line[2] - line[0]), abs(line[3] - line[1])) + 1 # Bresenham emits one pixel per step of the longer axis
+    for a in range(QUARTER): # Allocate one frame per angle of the first quarter turn
+        frames.append(array.array('b', bytes(2 * n))) # Local coords stay within +/-47, so int8 is enough
+    k = 0 # Write position shared by all frames
+    def emit(x, y): # Fused consumer: rotate each pixel into every frame as soon as it is generated
+        nonlocal k # Advance the shared write position
+        _emit_rotated(frames, k, x, y) # Write this pixel into all frames
+        k += 2 # Move to the next X,Y slot
+    for line in lines: # Iterate through all segments
+        bresenham_emit(line[0], line[1], line[2], line[3], emit) # Rasterize and rotate in a single pass
+
+def logo_aabb(a_idx): # Function to compute the screen-space bounding box of the rotated logo
+    s, c = sincos(a_idx) # Decode the sine/cosine pair from the quarter table
+    s = abs(s) # Corner spread only depends on the magnitude of the sine
+    c = abs(c) # Corner spread only depends on the magnitude of the cosine
+    hw = L_RIGHT * c + L_BOT * s # Half width of the four rotated corners (+/-45, +/-12)
+    hh = L_RIGHT * s + L_BOT * c # Half height of the four rotated corners (+/-45, +/-12)
+    return (int(CX - hw) - 2, int(CY - hh) - 2, int(CX + hw) + 2, int(CY + hh) + 2) # Pad 2 pixels: flooring both Q16 products can overshoot a corner by up to c + s <= 1.42
+
+@micropython.viper
+def _sim_snow(ground, active_g, g_dirty, par): # Viper kernel: move, land and pile up falling snow in Q16.16 over raw array pointers
+    sx = ptr32(sn_x) # Raw int32 pointer over the Q16 X positions
+    sy = ptr32(sn_y) # Raw int32 pointer over the Q16 Y positions
+    svx = ptr32(sn_vx) # Raw int32 pointer over the Q16 X velocities
+    svy = ptr32(sn_vy) # Raw int32 pointer over the Q16 Y velocities
+    gr = ptr16(ground) # Raw uint16 pointer over the ground heights
+    pp = ptr32(par) # Raw int32 pointer over the per-frame scalars
+    c_q = pp[0] # Q16 cosine of the current angle
+    s_q = pp[1] # Q16 sine of the current angle
+    xmin = pp[2] # Logo bounding box left
+    ymin = pp[3] # Logo bounding box top
+    xmax = pp[4] # Logo bounding box right
+    ymax = pp[5] # Logo bounding box bottom
+    scr_h = pp[6] # Dynamic screen height
+    g_chunks = pp[7] # Dynamic ground chunk count
+    cx = pp[8] # Dynamic horizontal center
+    cy = pp[9] # Dynamic vertical center
+    grav = int(GRAVITY_Q) # Unbox the Q16 gravity once
+    l_left = int(L_LEFT) # Unbox the logo edges once
+    l_right = int(L_RIGHT) # Unbox the logo edges once
+    l_top = int(L_TOP) # Unbox the logo edges once
+    l_bot = int(L_BOT) # Unbox the logo edges once
+    cap = int(MAX_PILE) # Unbox the shared pile capacity once
+    sn_mask = int(state["sn_mask"]) # Pull the active snowflake bitmask into a machine word
+    pl_n = state["pl_n"] # Pull the per-edge active pile counts into a local register
+    bits = sn_mask # Snapshot of the active bits still to visit
+    i = -1 # Slot index of the last bit consumed from the snapshot
+    while bits: # Stop as soon as no active snowflakes remain
+        if (bits & 15) == 0: # BITWISE MATH: Four dormant slots in a row
+            bits >>= 4 # Skip them all at once
+            i += 4 # Advance the slot index past them
+            continue # Test the next group
+        i += 1 # Advance to the slot of the lowest remaining bit
+        bit = bits & 1 # Extract its active flag
+        bits >>= 1 # Consume the bit
+        if bit == 0: continue # Skip dormant snowflakes instantly
+
+        vy = svy[i] + grav # Calculate new Y velocity with an integer add
+        svy[i] = vy # Save new Y velocity
+        x_q = sx[i] + svx[i] # Apply X velocity
+        y_q = sy[i] + vy # Apply Y velocity
+        sx[i] = x_q # Save new X position
+        sy[i] = y_q # Save new Y position
+        x = x_q >> 16 # BITWISE MATH: Drop the fraction to get the whole pixel X
+        y = y_q >> 16 # BITWISE MATH: Drop the fraction to get the whole pixel Y
+
+        landed = 0 # Initialize landing flag
+        chunk = x >> 2 # BITWISE MATH: Divide X by 4 to find ground chunk mapping
+
+        if chunk >= 0 and chunk < g_chunks: # Ensure chunk mapping is within the dynamic screen bounds
+            g = int(gr[chunk]) # Load the ground top of this chunk
+            if y + 4 >= g: # Check ground collision adjusted for the larger 4x4 size
+                g -= 4 # Raise ground level locally by 4 pixels to match the big flake
+                if g < 0: g = 0 # Clamp at the top of the screen, the uint16 buffer cannot go negative
+                gr[chunk] = g # Store the raised ground
+                active_g.add(chunk) # Track the chunk as raised so melt and render can find it
+                g_dirty.add(chunk) # Mark the chunk for a partial redraw
+                landed = 1 # Mark as landed
+
+        if landed == 0 and x >= xmin and x <= xmax and y >= ymin and y <= ymax: # Cull before project: only flakes near the logo
+            dx = x - cx # Translate to local X using cached dynamic center
+            dy = y - cy # Translate to local Y using cached dynamic center
+            lx = (dx * c_q + dy * s_q) >> 16 # INLINE MATH: Inverse rotate X in fixed point
+            ly = (dy * c_q - dx * s_q) >> 16 # INLINE MATH: Inverse rotate Y in fixed point
+
+            if lx >= l_left and lx <= l_right and ly >= l_top and ly <= l_bot: # Check bounding box
+                edge = 0 # Top edge candidate first, positioned along X
+                best = ly - l_top # Dist to top (inside the box, so never negative)
+                v = lx # Coordinate along the top edge
+                d = l_bot - ly # Dist to bot
+                if d < best: # Strictly closer, so ties keep the T/B/L/R priority
+                    edge = 1 # Bot edge, positioned along X
+                    best = d # New closest distance
+                d = lx - l_left # Dist to left
+                if d < best: # Strictly closer
+                    edge = 2 # Left edge, positioned along Y
+                    best = d # New closest distance
+                    v = ly # Coordinate along the left edge
+                d = l_right - lx # Dist to right
+                if d < best: # Strictly closer
+                    edge = 3 # Right edge, positioned along Y
+                    v = ly # Coordinate along the right edge
+                if int(pl_n[0]) + int(pl_n[1]) + int(pl_n[2]) + int(pl_n[3]) < cap: # The edges share one MAX_PILE capacity, so any edge can hold the whole pile
+                    p = int(pl_free[edge].pop()) # O(1) ALLOCATION: Pop the free pile pixel index
+                    act = ptr8(pl_act[edge]) # Raw byte pointer over the chosen edge's active flags
+                    act[p] = 1 # Wake up by setting its active flag
+                    pl_n[edge] = int(pl_n[edge]) + 1 # Count it on its edge
+                    pl_pos[edge][p] = v # Snap onto the chosen edge
+                    pl_sv[edge][p] = 0.0 # Reset sliding
+                landed = 1 # Mark as landed
+
+        if landed or y >= scr_h: # If it hit something or fell completely past the dynamic screen height
+            sn_mask ^= 1 << i # BITWISE MATH: Put snowflake back to sleep by flipping its known-set active bit
+            sn_free.append(i) # Return the index to the snow free-list
+
+    state["sn_mask"] = sn_mask # Write the updated snowflake bitmask back
+
+def edge_axis(e, c, s): # Function returning the rotated local origin and direction of edge e as (ox, oy, dx, dy)
+    if e < 2: # Top/Bot edges run along local X at a fixed local Y
+        fy = L_TOP if e == 0 else L_BOT # Fixed local Y of this edge
+        return (-fy * s, fy * c, c, s) # Rotate (0, fy) and the X axis
+    fx = L_LEFT if e == 2 else L_RIGHT # Left/Right edges run along local Y at a fixed local X
+    return (fx * c, fx * s, -s, c) # Rotate (fx, 0) and the Y axis
+
+def _sim_pile(gx, gy, c_ang, s_ang, cx, cy): # Function to slide every edge's pile sub-pool along edge gravity
+    _slide_edge(0, gx, gy < 0, L_LEFT, L_RIGHT, edge_axis(0, c_ang, s_ang), cx, cy) # Top: slides along X, falls when upside down
+    _slide_edge(1, gx, gy > 0, L_LEFT, L_RIGHT, edge_axis(1, c_ang, s_ang), cx, cy) # Bot: slides along X, falls when upside down
+    _slide_edge(2, gy, gx > 0, L_TOP, L_BOT, edge_axis(2, c_ang, s_ang), cx, cy) # Left: slides along Y, falls when sideways
+    _slide_edge(3, gy, gx < 0, L_TOP, L_BOT, edge_axis(3, c_ang, s_ang), cx, cy) # Right: slides along Y, falls when sideways
+
+@micropython.native
+def _slide_edge(e, accel, drop, lo, hi, axis, cx, cy): # Native kernel: slide one edge's sub-pool, dropping pixels off its ends
+    pos = pl_pos[e] # Pull this edge's coordinate array into a local register
+    vel = pl_sv[e] # Pull this edge's sliding velocity array into a local register
+    free = pl_free[e] # Pull this edge's free-list into a local register
+    act = pl_act[e] # Pull this edge's active flags into a local register
+    pl_n = state["pl_n"] # Pull the per-edge active pile counts into a local register
+    left = pl_n[e] # Active pile pixels of this edge still to visit
+    sn_mask = state["sn_mask"] # Pull the active snowflake bitmask into a local register
+    ox, oy, dx, dy = axis # Unpack the rotated edge origin and sliding direction
+    fr = FRICTION # Cache the friction factor locally
+    p = -1 # Slot index of the last slot visited
+    while left: # Stop as soon as every active pile pixel was visited
+        p += 1 # Advance to the next slot
+        if not act[p]: continue # Skip dormant pixels
+        left -= 1 # One fewer active pixel to find
+
+        sv = vel[p] # Load sliding velocity
+        v = pos[p] # Load the coordinate along the edge
+        if not drop: # Sliding (same answer for the whole sub-pool this frame)
+            sv = (sv + accel) * fr # Accelerate and apply friction
+            v += sv # Update the relative coordinate along the edge
+            pos[p] = v # Save it
+            vel[p] = sv # Save updated velocity
+            if lo <= v <= hi: continue # Still on the edge
+
+        act[p] = 0 # Slid off the edge: sleep pixel by clearing its active flag
+        pl_n[e] -= 1 # Drop it from the edge count
+        free.append(p) # Return the index to the edge's free-list
+        if not sn_free: continue # Falling pool is full, the pixel simply melts away
+
+        i = sn_free.pop() # O(1) ALLOCATION: Reuse a dormant flake slot directly
+        sn_mask |= 1 << i # Wake up by setting its active bit
+        sn_x[i] = int((ox + v * dx + cx) * 65536) # Assign Q16 absolute X using dynamic center
+        sn_y[i] = int((oy + v * dy + cy) * 65536) # Assign Q16 absolute Y using dynamic center
+        sn_vx[i] = int(sv * dx * 65536) # Assign Q16 X velocity along the sliding direction
+        sn_vy[i] = int((sv * dy + 1.0) * 65536) # Assign Q16 Y velocity along the sliding direction plus a push down
+
+    state["sn_mask"] = sn_mask # Write the updated snowflake bitmask back
+
+@micropython.viper
+def _offset_pts(src, dst, n: int, geo): # Viper kernel: turn the first n int8 entries by a quadrant matrix and shift them into the int16 buffer
+    s = ptr8(src) # Raw byte pointer over the int8 local coordinates
+    d = ptr16(dst) # Raw halfword pointer over the int16 scratch buffer
+    g = ptr32(geo) # Raw int32 pointer over (ox, oy, xx, xy, yx, yy)
+    ox = g[0] # Screen X offset
+    oy = g[1] # Screen Y offset
+    xx = g[2] # Quadrant matrix: X from X
+    xy = g[3] # Quadrant matrix: X from Y
+    yx = g[4] # Quadrant matrix: Y from X
+    yy = g[5] # Quadrant matrix: Y from Y
+    i = 0 # Read and write position
+    while i < n: # Walk the flat buffer two coordinates at a time
+        x = int(s[i]) # Load local X
+        if x > 127: x -= 256 # ptr8 reads unsigned bytes, so sign-extend the int8 coordinate
+        y = int(s[i + 1]) # Load local Y
+        if y > 127: y -= 256 # Sign-extend the int8 coordinate
+        d[i] = xx * x + xy * y + ox # Turn and shift X, no trig, just swaps and sign flips
+        d[i + 1] = yx * x + yy * y + oy # Turn and shift Y
+        i += 2 # Advance to the next pair
+
+def plot_pts(draw, pts, n, color, ox, oy, q): # Function to draw n/2 local X,Y pairs turned by q quarter turns and shifted by (ox, oy) in one batch
+    m = QUAD_M[q] # Integer matrix of this quadrant
+    geo = xy_geo # Pull the shared kernel parameter array into a fast local variable
+    geo[0] = ox # Screen X offset
+    geo[1] = oy # Screen Y offset
+    geo[2] = m[0] # Quadrant matrix: X from X
+    geo[3] = m[1] # Quadrant matrix: X from Y
+    geo[4] = m[2] # Quadrant matrix: Y from X
+    geo[5] = m[3] # Quadrant matrix: Y from Y
+    _offset_pts(pts, xy_buf, n, geo) # Build the absolute coordinates in the scratch buffer
+    if pixel_sink is not None: # One call per point cloud instead of one per pixel
+        view = xy_views[n >> 1] # BITWISE MATH: Cached view of exactly n coordinates
+        if view is None: # First cloud of this length
+            view = memoryview(xy_buf)[:n] # Slice it once
+            xy_views[n >> 1] = view # Later frames reuse it without allocating
+        pixel_sink(view, color) # Hand the whole buffer to the sink at once as draw.pixels(xy_array, color)
+        return # Done with this point cloud
+    dp = draw.pixel # Fallback: cache the single pixel drawing method
+    for i in range(0, n, 2): # Walk the flat buffer two coordinates at a time
+        v_pixel.x = xy_buf[i] # Set the absolute X
+        v_pixel.y = xy_buf[i + 1] # Set the absolute Y
+        dp(v_pixel, color) # Draw pixel
+
+def overlaps(x0, y0, x1, y1, box): # Function to test an inclusive rect against an inclusive (xmin, ymin, xmax, ymax) box
+    return x0 <= box[2] and x1 >= box[0] and y0 <= box[3] and y1 >= box[1] # Separating axis test on both axes
+
+def fill_rect(fr, x, y, w, h, color): # Function to fill one solid rect through the shared Vectors (draw.rect only draws an outline)
+    v_pos.x = x # Set X
+    v_pos.y = y # Set Y
+    v_size.x = w # Set Width
+    v_size.y = h # Set Height
+    fr(v_pos, v_size, color) # Fill the rect
+
+@micropython.native
+def _same_pts(a, b, n, m): # Native kernel: check whether two flat X,Y buffers hold the same first n entries
+    if n != m: return False # Different pixel counts can never match
+    for i in range(n): # Walk both buffers in lockstep
+        if a[i] != b[i]: return False # Bail out on the first difference
+    return True # Every coordinate matched
+
+@micropython.native
+def _copy_pts(src, dst, n): # Native kernel: copy the first n entries of a flat X,Y buffer
+    for i in range(n): # Walk the buffer
+        dst[i] = src[i] # Copy the coordinate
+
+def flakes_in(pts, n, box): # Function to check whether any 4x4 flake in a flat X,Y buffer touches a box
+    for i in range(0, n, 2): # Walk the flat buffer two coordinates at a time
+        x = pts[i] # Load X
+        y = pts[i + 1] # Load Y
+        if overlaps(x, y, x + 3, y + 3, box): return True # The flake covers part of the box
+    return False # No flake touches the box
+
+def fill_snow_pts(): # Function to collect the whole pixel positions of the active snowflakes into snow_pts
+    n = 0 # Number of coordinates written into the snow buffer
+    bits = state["sn_mask"] # Walk the active snowflake bits
+    i = 0 # Slot index of the lowest remaining bit
+    while bits: # Stop as soon as no active snowflakes remain
+        if bits & 1: # If active
+            snow_pts[n] = sn_x[i] >> 16 # BITWISE MATH: Whole pixel X from Q16
+            snow_pts[n + 1] = sn_y[i] >> 16 # BITWISE MATH: Whole pixel Y from Q16
+            n += 2 # Advance the buffer write position
+        bits >>= 1 # Consume the bit
+        i += 1 # Advance to the next slot
+    return n # Hand back the number of coordinates written
+
+def fill_pile_pts(c_ang, s_ang): # Function to rotate the active pile pixels of every edge into pile_pts
+    _int = int # Cache the integer cast function locally
+    n = 0 # Number of coordinates written into the pile buffer
+    pl_n = state["pl_n"] # Pull the per-edge active pile counts into a fast local variable
+    for e in range(4): # Walk the four edge sub-pools
+        left = pl_n[e] # Active pile pixels of this edge
+        if not left: continue # Skip edges without snow
+        act = pl_act[e] # Active flags of this edge
+        pos = pl_pos[e] # Coordinates along this edge
+        ox, oy, dx, dy = edge_axis(e, c_ang, s_ang) # Rotated origin and direction of this edge
+        i = 0 # Slot index to test next
+        while left: # Stop as soon as every active pile pixel was placed
+            if act[i]: # If active
+                v = pos[i] # Load the coordinate along the edge
+                pile_pts[n] = _int(ox + v * dx) # Rotate X around the logo origin
+                pile_pts[n + 1] = _int(oy + v * dy) # Rotate Y around the logo origin
+                n += 2 # Advance the buffer write position
+                left -= 1 # One fewer active pixel to find
+            i += 1 # Advance to the next slot
+    return n # Hand back the number of coordinates written
+
+def paint_ground(fr, ground, active_g, scr_h): # Function to draw every raised ground chunk as equal-height span rects
+    if not active_g: return # Only walk the ground when some chunk holds snow
+    lo = min(active_g) # Leftmost raised chunk
+    hi = max(active_g) + 1 # One past the rightmost raised chunk
+    run_start = lo # First chunk of the current equal-height span
+    run_y = ground[lo] # Shared top Y of the current span
+    for i in range(lo + 1, hi + 1): # The extra step past the last chunk flushes the final span
+        y_top = ground[i] if i < hi else scr_h # Extract top Y, using the floor as the end sentinel
+        if y_top != run_y: # Height changes, so the current span ends here
+            if run_y < scr_h: # Skip spans that sit flat on the floor
+                fill_rect(fr, run_start << 2, run_y, (i - run_start) << 2, scr_h - run_y, TFT_WHITE) # BITWISE MATH: Draw the whole span 4 pixels per chunk down to the floor
+            run_start = i # Start a new span at this chunk
+            run_y = y_top # Remember its height
+
+def repair_ground(fr, ground, box, scr_h, g_chunks): # Function to repaint the ground inside a box after it was erased
+    lo = max(box[0] >> 2, 0) # BITWISE MATH: First chunk touching the box
+    hi = min(box[2] >> 2, g_chunks - 1) # BITWISE MATH: Last chunk touching the box
+    for i in range(lo, hi + 1): # Walk only the chunks under the box
+        top = max(ground[i], box[1]) # Ground top clipped to the box
+        bot = min(scr_h - 1, box[3]) # Floor clipped to the box
+        if top > bot: continue # This chunk has no ground inside the box
+        x0 = max(i << 2, box[0]) # BITWISE MATH: Chunk left edge clipped to the box
+        x1 = min((i << 2) + 3, box[2]) # BITWISE MATH: Chunk right edge clipped to the box
+        fill_rect(fr, x0, top, x1 - x0 + 1, bot - top + 1, TFT_WHITE) # Restore the ground pixels in one rect
+
+def erase_flakes(fr, pts, n, drawn_g, scr_h, g_chunks): # Function to black out old 4x4 flakes without cutting into the drawn ground
+    for i in range(0, n, 2): # Walk the flat buffer two coordinates at a time
+        x = pts[i] # Load X
+        y = pts[i + 1] # Load Y
+        for c in range(x >> 2, ((x + 3) >> 2) + 1): # BITWISE MATH: A 4 pixel flake straddles at most two chunks
+            gy = drawn_g[c] if 0 <= c < g_chunks else scr_h # Ground top under this part of the flake
+            x0 = max(x, c << 2) # BITWISE MATH: Flake part starting at this chunk
+            x1 = min(x + 4, (c + 1) << 2) # BITWISE MATH: Flake part ending at this chunk
+            h = min(y + 4, gy) - y # Stop the erase at the ground top
+            if h > 0 and x1 > x0: # Anything left above the ground
+                fill_rect(fr, x0, y, x1 - x0, h, TFT_BLACK) # Wipe that part of the flake
+
+def paint_flakes(dr, pts, n): # Function to draw every 4x4 flake of a flat X,Y buffer
+    for i in range(0, n, 2): # Walk the flat buffer two coordinates at a time
+        v_pos.x = pts[i] # Set X
+        v_pos.y = pts[i + 1] # Set Y
+        dr(v_pos, v_flake, TFT_WHITE) # Draw the large 4x4 flake
+
+def paint_logo(draw, a_idx, box_color, text_color): # Function to draw the pre-rotated logo frames for one angle
+    q, r = divmod(a_idx, QUARTER) # Quadrant to turn by and frame within the first quarter turn
+    q &= 3 # BITWISE MATH: Wrap the quadrant, same decode as sincos()
+    pts = box_rot[r] # Fetch the pre-rotated box frame for this angle
+    plot_pts(draw, pts, len(pts), box_color, CX, CY, q) # Draw the box in one batch around the dynamic center
+    pts = text_rot[r] # Fetch the pre-rotated text frame for this angle
+    plot_pts(draw, pts, len(pts), text_color, CX, CY, q) # Draw the text in one batch around the dynamic center
+
+def paint_ui(draw, stage, rot_on): # Function to draw the help text for the current stage
+    lines = UI_WAIT if stage == 0 else UI_ROTATING if rot_on else UI_PAUSED # Pick the help text for this stage
+    for x, y, text in lines: # Walk the lines of the help text
+        v_pos.x = x # Set UI X
+        v_pos.y = y # Set UI Y
+        draw.text(v_pos, text, TFT_YELLOW) # Draw text updates help screen dynamically
+
+def paint_scene(draw, stage, rot_on, a_idx, ground, active_g, n_snow, n_pile): # Function to paint every layer onto a black screen
+    paint_ground(draw.fill_rectangle, ground, active_g, SCREEN_H) # Bottom layer: the solid ground spans
+    paint_flakes(draw.rect, snow_pts, n_snow) # Falling snow over the ground
+    paint_logo(draw, a_idx, TFT_BLUE, TFT_CYAN) # Blue box and cyan text over the snow
+    plot_pts(draw, pile_pts, n_pile, TFT_WHITE, CX, CY, 0) # Pile pixels sit on the logo
+    paint_ui(draw, stage, rot_on) # Help text on top of everything
+
 def start(view_manager): # Lifecycle function called when the app starts or resets
-    global SCREEN_W, SCREEN_H, CX, CY, GROUND_CHUNKS # Declare globals to modify them dynamically
+    global SCREEN_W, SCREEN_H, CX, CY, GROUND_CHUNKS, xy_buf, xy_views, pixel_sink # Declare globals to modify them dynamically
     SCREEN_W = view_manager.draw.size.x # Ask the hardware for the exact full screen width
     SCREEN_H = view_manager.draw.size.y # Ask the hardware for the exact full screen height
     CX = SCREEN_W // 2 # Mathematically calculate the exact horizontal center
@@ -107,20 +512,40 @@ def start(view_manager): # Lifecycle function called when the app starts or rese
     state["start_time"] = time.ticks_ms() # Record the exact millisecond the app launched
     state["a_idx"] = 0 # Reset the logo rotation index to 0 (flat)
     state["rot"] = False # Ensure rotation is paused when the app starts
-    state["ground"] = [SCREEN_H] * GROUND_CHUNKS # Initialize the ground chunks array mapping the full screen width
+    state["ground"] = array.array('H', [SCREEN_H] * GROUND_CHUNKS) # Initialize the packed uint16 ground chunks mapping the full screen width
+    state["active_g"] = set() # Initialize the set of ground chunks currently raised above the floor
     state["tick"] = 0 # Initialize a frame counter for the melting optimization
+    state["rp"] = random.randrange(RAND_MASK + 1) # Start reading the random pool at a fresh offset each run
+    state["logo_aabb"] = logo_aabb(0) # Initialize the logo bounding box for the flat angle
+    sim_par[6] = SCREEN_H # Hand the dynamic screen height to the snow kernel
+    sim_par[7] = GROUND_CHUNKS # Hand the dynamic ground chunk count to the snow kernel
+    sim_par[8] = CX # Hand the dynamic horizontal center to the snow kernel
+    sim_par[9] = CY # Hand the dynamic vertical center to the snow kernel
+    state["g_dirty"] = set() # Initialize the set of ground chunks changed since the last frame
+    state["drawn_g"] = array.array('H', [SCREEN_H] * GROUND_CHUNKS) # Ground heights currently on screen
+    state["full"] = True # Paint the first frame from scratch
+    state["dirty"] = True # Request a draw for the first frame
+    state["snow_n"] = 0 # No snowflake coordinates on screen yet
+    state["pile_n"] = 0 # No pile coordinates on screen yet
+    state["drawn_a"] = 0 # The logo has not been turned on screen yet
     
-    for i in range(MAX_SNOW): sn_act[i] = False # Hard reset all snowflakes to dormant
-    for i in range(MAX_PILE): pl_act[i] = False # Hard reset all pile pixels to dormant
-    box_pts.clear() # Empty the global point cloud cache for the box
-    text_pts.clear() # Empty the global point cloud cache for the text
-    
-    cache_line(box_pts, L_LEFT, L_TOP, L_RIGHT, L_TOP) # Cache top edge of logo
-    cache_line(box_pts, L_RIGHT, L_TOP, L_RIGHT, L_BOT) # Cache right edge of logo
-    cache_line(box_pts, L_RIGHT, L_BOT, L_LEFT, L_BOT) # Cache bottom edge of logo
-    cache_line(box_pts, L_LEFT, L_BOT, L_LEFT, L_TOP) # Cache left edge of logo
-    for line in LOGO_LINES: # Iterate through all "Slasher006" text segments
-        cache_line(text_pts, line[0], line[1], line[2], line[3]) # Cache the text pixels
+    state["sn_mask"] = 0 # Hard reset all snowflakes to dormant
+    state["pl_n"] = [0, 0, 0, 0] # Hard reset the active pile count of every edge
+    sn_free.clear() # Empty the snow free-list before refilling it
+    sn_free.extend(range(MAX_SNOW)) # Every snowflake slot starts out free
+    for e in range(4): # Walk the four edge sub-pools
+        act = pl_act[e] # Active flags of this edge
+        for p in range(len(act)): act[p] = 0 # Hard reset every pile pixel on this edge to dormant
+        pl_free[e].clear() # Empty the pile free-list before refilling it
+        pl_free[e].extend(range(MAX_PILE - 1, -1, -1)) # Every pile pixel slot starts out free, lowest slot on top
+
+    if not box_rot: # The rotation cache does not depend on screen size, so a reset keeps it
+        gc.collect() # Make room before allocating the cache
+        cache_rotated(box_rot, BOX_LINES) # Rasterize and pre-rotate the box outline for every angle of the first quarter turn
+        cache_rotated(text_rot, LOGO_LINES) # Rasterize and pre-rotate the "Slasher006" text for every angle of the first quarter turn
+        xy_buf = array.array('h', bytes(2 * max(len(box_rot[0]), len(text_rot[0]), len(pile_pts)))) # Size the pixel sink scratch for the largest cloud
+        xy_views = [None] * (len(xy_buf) // 2 + 1) # Drop views of any old buffer; one slot per possible length
+    pixel_sink = getattr(view_manager.draw, "pixels", None) # Look for the framework's batched pixel sink once per launch
         
     view_manager.draw.fill_screen(TFT_BLACK) # Clear the entire screen to black
     view_manager.draw.swap() # Push the black frame to the physical display
@@ -134,11 +559,8 @@ def run(view_manager): # Lifecycle function called every single frame
     
     # --- FUNCTION CACHING FOR EXTREME LOOP SPEED ---
     _int = int # Cache the integer cast function locally
-    _abs = abs # Cache the absolute value function locally
-    _min = min # Cache the minimum value function locally
     _rand = random.random # Cache the random float generator locally
-    _rand_r = random.randrange # Cache the random integer generator locally
-    _rand_u = random.uniform # Cache the random uniform generator locally
+    _pool = RAND_POOL # Cache the pre-generated random pool locally
     
     # --- VARIABLE CACHING FOR EXTREME LOOP SPEED ---
     _scr_w = SCREEN_W # Cache the dynamic screen width locally
@@ -154,6 +576,7 @@ def run(view_manager): # Lifecycle function called every single frame
         return # Halt execution of the current frame immediately
     if button == BUTTON_G and state["stage"] == 1: # Check if 'g' was pressed during active stage
         state["rot"] = not state["rot"] # Toggle the boolean rotation state (Play/Pause)
+        state["dirty"] = True # The help text changes, so the next frame must be drawn
         input_mgr.reset() # Clear the button press state
     if button == BUTTON_R: # Check if 'r' was pressed at any time
         start(view_manager) # Call the start function to trigger a hard reset
@@ -162,207 +585,131 @@ def run(view_manager): # Lifecycle function called every single frame
 
     if state["stage"] == 0 and time.ticks_diff(now, state["start_time"]) > 5000: # Check wait phase timer
         state["stage"] = 1 # Advance to the active snowing phase
-            
+        state["full"] = True # The help text changes completely, so repaint the whole screen once
+        state["dirty"] = True # Request a draw for the new stage
+
+    stage = state["stage"] # Pull the current stage into a fast local variable
+    rot_on = state["rot"] # Pull the rotation toggle into a fast local variable
+    ground = state["ground"] # Pull the ground chunk list into a fast local variable
+    active_g = state["active_g"] # Pull the raised chunk set into a fast local variable
     a_idx = state["a_idx"] # Pull the current angle index into a fast local variable
-    s_ang = SIN_LUT[a_idx] # Instantly lookup the sine value from RAM without math
-    c_ang = COS_LUT[a_idx] # Instantly lookup the cosine value from RAM without math
+    s_ang, c_ang = sincos(a_idx) # Decode the sine/cosine pair from the quarter table without math
+    aabb = state["logo_aabb"] # Pull the logo bounding box matching this angle index
             
-    if state["stage"] == 1: # Check if the application is fully active
-        state["tick"] += 1 # Increment the global frame counter
+    if stage == 1: # Check if the application is fully active
+        tick = state["tick"] + 1 # Increment the global frame counter in a fast local variable
+        state["tick"] = tick # Write the scalar frame counter back
         
         # --- MELTING OPTIMIZATION LOGIC ---
-        if state["tick"] % MELT_RATE == 0: # Check if it is time to melt the snow based on the delayed MELT_RATE
-            for i in range(_g_chunks): # Iterate through all available dynamic ground chunks
-                if state["ground"][i] < _scr_h: # If there is snow piled up in this chunk above the floor
-                    state["ground"][i] += 1 # Melt it by pushing the top Y coordinate down 1 pixel towards the floor
+        if tick % MELT_RATE == 0: # Check if it is time to melt the snow based on the delayed MELT_RATE
+            empty = [] # Collect chunks that melt flat, since the set cannot shrink while iterating
+            g_dirty = state["g_dirty"] # Pull the set of chunks to redraw into a fast local variable
+            for i in active_g: # Iterate only through the chunks that actually hold snow
+                ground[i] += 1 # Melt it by pushing the top Y coordinate down 1 pixel towards the floor
+                g_dirty.add(i) # Mark the chunk for a partial redraw
+                if ground[i] >= _scr_h: empty.append(i) # Chunk is back at floor level
+            for i in empty: active_g.discard(i) # Stop tracking the fully melted chunks
         
         if _rand() < 0.4: # Spawning check: 40% chance per frame using cached random
-            for i in range(MAX_SNOW): # Loop through snowflake pool indices
-                if not sn_act[i]: # Find first dormant snowflake
-                    sn_act[i] = True # Wake it up
-                    sn_x[i] = _rand_r(0, _scr_w) # Assign random X spanning the entire dynamic width
-                    sn_y[i] = -5.0 # Assign Y above screen
-                    sn_vx[i] = _rand_u(-0.3, 0.3) # Assign wind drift
-                    sn_vy[i] = _rand_u(0.5, 1.5) # Assign fall speed
-                    sn_px[i] = sn_x[i] # Init previous X
-                    sn_py[i] = sn_y[i] # Init previous Y
-                    break # Break loop after spawning one
+            if sn_free: # Only spawn if a dormant snowflake is available
+                i = sn_free.pop() # O(1) ALLOCATION: Pop a dormant snowflake index
+                state["sn_mask"] |= 1 << i # Wake it up by setting its active bit
+                rp = state["rp"] # Read position in the random pool
+                sn_x[i] = _int(_pool[rp] * _scr_w) << 16 # Assign random Q16 X spanning the entire dynamic width
+                sn_y[i] = -5 << 16 # Assign Q16 Y above screen
+                sn_vx[i] = _int((_pool[(rp + 1) & RAND_MASK] - 0.5) * 0.6 * 65536) # Assign Q16 wind drift in -0.3..0.3
+                sn_vy[i] = _int((_pool[(rp + 2) & RAND_MASK] + 0.5) * 65536) # Assign Q16 fall speed in 0.5..1.5
+                state["rp"] = (rp + 3) & RAND_MASK # BITWISE MATH: Advance and wrap the pool read position
             
-        if state["rot"]: # If rotation is active
+        if rot_on: # If rotation is active
             state["a_idx"] = (a_idx + 1) % ROT_STEPS # Increment angle index and wrap around lookup table
+            state["logo_aabb"] = logo_aabb(state["a_idx"]) # Refresh the logo bounding box for the new angle
             
-        for i in range(MAX_SNOW): # Loop through all snowflake indices
-            if not sn_act[i]: continue # Skip dormant snowflakes instantly
-            
-            x = sn_x[i] # Load X to local register
-            y = sn_y[i] # Load Y to local register
-            sn_px[i] = x # Store as previous X
-            sn_py[i] = y # Store as previous Y
-            
-            vy = sn_vy[i] + GRAVITY # Calculate new Y velocity
-            sn_vy[i] = vy # Save new Y velocity
-            x += sn_vx[i] # Apply X velocity
-            y += vy # Apply Y velocity
-            sn_x[i] = x # Save new X position
-            sn_y[i] = y # Save new Y position
-            
-            landed = False # Initialize landing flag
-            chunk = _int(x) >> 2 # BITWISE MATH: Divide X by 4 to find ground chunk mapping
-            
-            if 0 <= chunk < _g_chunks: # Ensure chunk mapping is within the dynamic screen bounds
-                if y + 4 >= state["ground"][chunk]: # Check ground collision adjusted for the larger 4x4 size
-                    state["ground"][chunk] -= 4 # Raise ground level locally by 4 pixels to match the big flake
-                    landed = True # Mark as landed
-                    
-            if not landed: # Check logo collision
-                dx = x - _cx # Translate to local X using cached dynamic center
-                dy = y - _cy # Translate to local Y using cached dynamic center
-                lx = dx * c_ang + dy * s_ang # INLINE MATH: Inverse rotate X
-                ly = -dx * s_ang + dy * c_ang # INLINE MATH: Inverse rotate Y
-                
-                if L_LEFT <= lx <= L_RIGHT and L_TOP <= ly <= L_BOT: # Check bounding box
-                    dt = _abs(ly - L_TOP) # Dist to top
-                    db = _abs(ly - L_BOT) # Dist to bot
-                    dl = _abs(lx - L_LEFT) # Dist to left
-                    dr = _abs(lx - L_RIGHT) # Dist to right
-                    m = _min(dt, db, dl, dr) # Find closest edge
-                    
-                    for p in range(MAX_PILE): # Find available pile pixel
-                        if not pl_act[p]: # If dormant
-                            pl_act[p] = True # Wake up
-                            pl_sv[p] = 0.0 # Reset sliding
-                            if m == dt: # Top edge
-                                pl_rx[p], pl_ry[p], pl_edge[p] = lx, L_TOP, 0 # Snap to top
-                            elif m == db: # Bot edge
-                                pl_rx[p], pl_ry[p], pl_edge[p] = lx, L_BOT, 1 # Snap to bot
-                            elif m == dl: # Left edge
-                                pl_rx[p], pl_ry[p], pl_edge[p] = L_LEFT, ly, 2 # Snap to left
-                            else: # Right edge
-                                pl_rx[p], pl_ry[p], pl_edge[p] = L_RIGHT, ly, 3 # Snap to right
-                            break # End pile search
-                    landed = True # Mark as landed
-                        
-            if landed or y >= _scr_h: # If it hit something or fell completely past the dynamic screen height
-                sn_act[i] = False # Put snowflake back to sleep
-
-        gx = s_ang * GRAVITY * 2.0 # X gravity along horizontal edges
-        gy = c_ang * GRAVITY * 2.0 # Y gravity along vertical edges
-        
-        for p in range(MAX_PILE): # Loop through pile pixels
-            if not pl_act[p]: continue # Skip dormant pixels
-            
-            e = pl_edge[p] # Load edge ID (0=T, 1=B, 2=L, 3=R)
-            fall = False # Init fall flag
-            sv = pl_sv[p] # Load sliding velocity
-            
-            if e == 0: # Top Edge
-                if gy < 0: fall = True # Upside down, fall off
-                else: # Sliding
-                    sv = (sv + gx) * FRICTION # Accelerate and apply friction
-                    rx = pl_rx[p] + sv # Update relative X
-                    pl_rx[p] = rx # Save relative X
-                    if rx < L_LEFT or rx > L_RIGHT: fall = True # Check ends
-            elif e == 1: # Bot Edge
-                if gy > 0: fall = True # Upside down, fall off
-                else: # Sliding
-                    sv = (sv + gx) * FRICTION # Accelerate and apply friction
-                    rx = pl_rx[p] + sv # Update relative X
-                    pl_rx[p] = rx # Save relative X
-                    if rx < L_LEFT or rx > L_RIGHT: fall = True # Check ends
-            elif e == 2: # Left Edge
-                if gx > 0: fall = True # Sideways, fall off
-                else: # Sliding
-                    sv = (sv + gy) * FRICTION # Accelerate and apply friction
-                    ry = pl_ry[p] + sv # Update relative Y
-                    pl_ry[p] = ry # Save relative Y
-                    if ry < L_TOP or ry > L_BOT: fall = True # Check ends
-            elif e == 3: # Right Edge
-                if gx < 0: fall = True # Sideways, fall off
-                else: # Sliding
-                    sv = (sv + gy) * FRICTION # Accelerate and apply friction
-                    ry = pl_ry[p] + sv # Update relative Y
-                    pl_ry[p] = ry # Save relative Y
-                    if ry < L_TOP or ry > L_BOT: fall = True # Check ends
-            
-            pl_sv[p] = sv # Save updated velocity
-            
-            if fall: # If slid off the edge
-                pl_act[p] = False # Sleep pixel
-                rx = pl_rx[p] # Load local X
-                ry = pl_ry[p] # Load local Y
-                ax = rx * c_ang - ry * s_ang + _cx # Convert to absolute X using dynamic center
-                ay = rx * s_ang + ry * c_ang + _cy # Convert to absolute Y using dynamic center
-                if e < 2: # Horizontal edge falling momentum
-                    vx, vy = sv * c_ang, sv * s_ang + 1.0 # Calc trajectories
-                else: # Vertical edge falling momentum
-                    vx, vy = -sv * s_ang, sv * c_ang + 1.0 # Calc trajectories
-                    
-                for i in range(MAX_SNOW): # Re-add to falling pool
-                    if not sn_act[i]: # Find dormant flake
-                        sn_act[i] = True # Wake up
-                        sn_x[i], sn_y[i] = ax, ay # Assign position
-                        sn_px[i], sn_py[i] = ax, ay # Assign prev position
-                        sn_vx[i], sn_vy[i] = vx, vy # Assign velocities
-                        break # Stop looking
-
-    draw.fill_screen(TFT_BLACK) # Wipe screen
-    dp = draw.pixel # Cache drawing method
-    dr = draw.rect # Cache drawing method
-    
-    for i in range(_g_chunks): # Render Ground chunks spanning full dynamic width
-        y_top = state["ground"][i] # Extract top Y
-        if y_top < _scr_h: # If accumulated above dynamic screen height
-            v_pos.x = i << 2 # BITWISE MATH: i * 4
-            v_pos.y = y_top # Set Y
-            v_size.x = 4 # Set Width
-            v_size.y = _scr_h - y_top # Set Height dynamically to reach the floor
-            dr(v_pos, v_size, TFT_WHITE) # Draw chunk
-            
-    for i in range(MAX_SNOW): # Render Falling Snow
-        if sn_act[i]: # If active
-            v_pos.x = _int(sn_x[i]) # Set X
-            v_pos.y = _int(sn_y[i]) # Set Y
-            dr(v_pos, v_flake, TFT_WHITE) # Draw the large 4x4 flake
-            
-    for i in range(0, len(box_pts), 2): # Render Box Point Cloud
-        px, py = box_pts[i], box_pts[i+1] # Load local coords
-        v_pixel.x = _int(px * c_ang - py * s_ang) + _cx # Rotate X using dynamic center
-        v_pixel.y = _int(px * s_ang + py * c_ang) + _cy # Rotate Y using dynamic center
-        dp(v_pixel, TFT_BLUE) # Draw blue pixel
-        
-    for i in range(0, len(text_pts), 2): # Render Text Point Cloud
-        px, py = text_pts[i], text_pts[i+1] # Load local coords
-        v_pixel.x = _int(px * c_ang - py * s_ang) + _cx # Rotate X using dynamic center
-        v_pixel.y = _int(px * s_ang + py * c_ang) + _cy # Rotate Y using dynamic center
-        dp(v_pixel, TFT_CYAN) # Draw cyan pixel
-
-    for i in range(MAX_PILE): # Render Logo Pile
-        if pl_act[i]: # If active
-            px, py = pl_rx[i], pl_ry[i] # Load relative coords
-            v_pixel.x = _int(px * c_ang - py * s_ang) + _cx # Rotate X using dynamic center
-            v_pixel.y = _int(px * s_ang + py * c_ang) + _cy # Rotate Y using dynamic center
-            dp(v_pixel, TFT_WHITE) # Draw pile pixel
-
-    if state["stage"] == 0: # Render UI Phase 0
-        v_pos.x = 10 # Set UI X
-        v_pos.y = 10 # Set UI Y
-        draw.text(v_pos, "WAIT 5 SECONDS...", TFT_YELLOW) # Draw text updates help screen dynamically
-        v_pos.y = 25 # Move UI Y down for the next line
-        draw.text(v_pos, "[ESC]: EXIT", TFT_YELLOW) # Draw explicit escape instruction
-    elif state["stage"] == 1: # Render UI Phase 1
-        rot_status = "PAUSED" if not state["rot"] else "ROTATING" # Conditional string
-        v_pos.x = 5 # Set UI X
-        v_pos.y = 5 # Set UI Y
-        draw.text(v_pos, f"[G]: {rot_status}", TFT_YELLOW) # Draw toggle text updates help screen dynamically
-        v_pos.y = 20 # Move UI Y
-        draw.text(v_pos, "[R]: RESET", TFT_YELLOW) # Draw reset text updates help screen dynamically
-        v_pos.y = 35 # Move UI Y down for the next line
-        draw.text(v_pos, "[ESC]: EXIT", TFT_YELLOW) # Draw explicit escape instruction
+        par = sim_par # Pull the snow kernel parameter array into a fast local variable
+        par[0] = _int(c_ang * 65536) # Q16 cosine of the angle the logo is drawn at
+        par[1] = _int(s_ang * 65536) # Q16 sine of the angle the logo is drawn at
+        par[2], par[3], par[4], par[5] = aabb # Logo bounding box matching this angle
+        _sim_snow(ground, active_g, state["g_dirty"], par) # Advance falling snow in the viper kernel
+        _sim_pile(s_ang * GRAVITY * 2.0, c_ang * GRAVITY * 2.0, c_ang, s_ang, _cx, _cy) # Slide the pile along edge gravity in the native kernel
+
+    n_snow = fill_snow_pts() # Collect the whole pixel positions of the active snowflakes
+    n_pile = fill_pile_pts(c_ang, s_ang) # Rotate the active pile pixels into the pile buffer
+    drawn_g = state["drawn_g"] # Pull the ground heights currently on screen into a fast local variable
+    g_dirty = state["g_dirty"] # Pull the set of chunks whose height changed into a fast local variable
+    pile_same = _same_pts(pile_pts, pile_old, n_pile, state["pile_n"]) # Compare the pile with the one on screen once
+
+    if not (state["dirty"] or n_snow or state["snow_n"] or g_dirty or a_idx != state["drawn_a"] or not pile_same): # FRAME SKIP: the screen already shows this frame
+        return # Skip drawing and the swap entirely, leaving the display idle
+    state["dirty"] = False # Consume the pending redraw request
+
+    if state["full"] or not PARTIAL_REDRAW: # First frame of a stage, or a display that loses the frame: repaint everything from black
+        state["full"] = False # Later frames only touch what changed
+        draw.fill_screen(TFT_BLACK) # Wipe screen
+        paint_scene(draw, stage, rot_on, a_idx, ground, active_g, n_snow, n_pile) # Paint every layer in order
+        for i in range(_g_chunks): drawn_g[i] = ground[i] # The whole ground is now on screen
+        g_dirty.clear() # Nothing left to patch
+    else: # DIRTY RECTS: erase what moved, then repaint only the layers it touched
+        dr = draw.rect # Cache the flake drawing method
+        fr = draw.fill_rectangle # Cache the solid fill method for every erase and patch
+        old_box = state["drawn_aabb"] # Logo bounding box currently on screen
+        turned = a_idx != state["drawn_a"] # The logo is drawn at a new angle this frame
+        pile_moved = turned or not pile_same # Any pile pixel changed
+        ui_changed = rot_on != state["drawn_rot"] # The help text reads differently this frame
+        logo_hit = pile_moved # The logo must be redrawn when something over or under it changed
+        ui_hit = ui_changed # The help text must be redrawn when something under it changed
+
+        # --- ERASE ---
+        if ui_changed: # Wipe the old help text
+            fill_rect(fr, UI_BOX[0], UI_BOX[1], UI_BOX[2] - UI_BOX[0] + 1, UI_BOX[3] - UI_BOX[1] + 1, TFT_BLACK) # Clear the whole text box
+            repair_ground(fr, ground, UI_BOX, _scr_h, _g_chunks) # Put back any ground the wipe covered
+            if overlaps(old_box[0], old_box[1], old_box[2], old_box[3], UI_BOX): logo_hit = True # The wipe may have cut into the logo
+        n_old = state["snow_n"] # Number of snowflake coordinates currently on screen
+        erase_flakes(fr, snow_old, n_old, drawn_g, _scr_h, _g_chunks) # Wipe last frame's flakes above the ground
+        if flakes_in(snow_old, n_old, old_box): logo_hit = True # A wiped flake may have covered logo pixels
+        if flakes_in(snow_old, n_old, UI_BOX): ui_hit = True # A wiped flake may have covered help text
+        if pile_moved: # Wipe last frame's pile
+            plot_pts(draw, pile_old, state["pile_n"], TFT_BLACK, _cx, _cy, 0) # Black out the old pile pixels
+        if turned: # Wipe the logo at its old angle
+            paint_logo(draw, state["drawn_a"], TFT_BLACK, TFT_BLACK) # Black out the old logo pixels
+        if pile_moved: # The wipes above may have cut into the ground under the logo
+            repair_ground(fr, ground, old_box, _scr_h, _g_chunks) # Put back the ground inside the old logo box
+
+        # --- GROUND ---
+        for i in g_dirty: # Patch only the chunks whose height changed
+            old = drawn_g[i] # Height currently on screen
+            new = ground[i] # Height to show
+            if new == old: continue # Landed and melted back within the same frame
+            top = min(old, new) # Upper edge of the changed strip
+            bot = max(old, new) - 1 # Lower edge of the changed strip
+            x = i << 2 # BITWISE MATH: Chunk left edge
+            fill_rect(fr, x, top, 4, bot - top + 1, TFT_WHITE if new < old else TFT_BLACK) # Grow or melt just the changed strip
+            if overlaps(x, top, x + 3, bot, aabb): logo_hit = True # The strip touched the logo
+            if overlaps(x, top, x + 3, bot, UI_BOX): ui_hit = True # The strip touched the help text
+            drawn_g[i] = new # Remember the new height on screen
+        g_dirty.clear() # Every change is now on screen
+
+        # --- REPAINT ---
+        paint_flakes(dr, snow_pts, n_snow) # Falling snow always moves, so draw it every frame
+        if flakes_in(snow_pts, n_snow, aabb): logo_hit = True # A flake over the logo must sit under it
+        if flakes_in(snow_pts, n_snow, UI_BOX): ui_hit = True # A flake under the help text must sit under it
+        if logo_hit: # Something touched the logo area
+            paint_logo(draw, a_idx, TFT_BLUE, TFT_CYAN) # Draw the blue box and cyan text
+            plot_pts(draw, pile_pts, n_pile, TFT_WHITE, _cx, _cy, 0) # Draw the pile on the logo
+            if overlaps(old_box[0], old_box[1], old_box[2], old_box[3], UI_BOX) or overlaps(aabb[0], aabb[1], aabb[2], aabb[3], UI_BOX): ui_hit = True # Keep the help text on top
+        if ui_hit: # Something touched the help text
+            paint_ui(draw, stage, rot_on) # Draw the help text on top
+
+    state["snow_n"] = n_snow # Remember how many snowflake coordinates are on screen
+    _copy_pts(snow_pts, snow_old, n_snow) # Remember where they are to erase them next frame
+    state["pile_n"] = n_pile # Remember how many pile coordinates are on screen
+    _copy_pts(pile_pts, pile_old, n_pile) # Remember where they are to erase them next frame
+    state["drawn_a"] = a_idx # Remember the angle of the logo on screen
+    state["drawn_aabb"] = aabb # Remember the bounding box of the logo on screen
+    state["drawn_rot"] = rot_on # Remember which help text is on screen
 
     draw.swap() # Push final frame to display
 
 def stop(view_manager): # Cleanup on exit
-    import gc # Import garbage collector
-    box_pts.clear() # Clear box memory
-    text_pts.clear() # Clear text memory
+    box_rot.clear() # Clear the pre-rotated box frames
+    text_rot.clear() # Clear the pre-rotated text frames
     gc.collect() # Force memory reclaim